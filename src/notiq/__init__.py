@@ -1,137 +1,231 @@
-# import os
-
-from pydantic import ValidationError
-
-from notiq.config import Config
-from notiq.monitoring.builder import MetricBuilder
-from notiq.monitoring.decorators import monitor
-from notiq.monitoring.loggers import Logger
-from notiq.tasks.queue import notiq_task
-from notiq.tasks.scheduler import notiq_scheduler, notiq_unscheduler
-from notiq.tasks.worker import celery_app
-from notiq.utils.dicovery import autodiscover_tasks
-
-log = Logger("notiq_config", json_serialize=False).setup()
+# Public attributes are resolved lazily (PEP 562) so importing notiq stays
+# cheap: pulling in celery, pydantic-settings, and prometheus-client eagerly
+# costs hundreds of milliseconds that consumers who only need @monitor or
+# Logger should not pay. Each attribute is imported on first access and then
+# cached in the module globals, so __getattr__ only runs once per name.
 
+from typing import Any
 
 # __all__ defines what happens if someone types "from notiq import *"
 # so all the modules/classes/functions are exposed publicly.
 __all__ = [
     "monitor",
+    "monitor_sync",
+    "monitor_async",
     "MetricBuilder",
     "celery_app",
     "Logger",
     "notiq_scheduler",
     "notiq_unscheduler",
     "notiq_task",
+    "NotiqConfig",
 ]
 
 __version__ = "0.0.1"
 
+# Public attribute -> (module, attribute) resolved on first access.
+# "app" and "celery" are aliases for celery_app so `celery -A notiq worker`
+# still finds the app even though nothing is imported eagerly.
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "monitor": ("notiq.monitoring.decorators", "monitor"),
+    "monitor_sync": ("notiq.monitoring.decorators", "monitor_sync"),
+    "monitor_async": ("notiq.monitoring.decorators", "monitor_async"),
+    "MetricBuilder": ("notiq.monitoring.builder", "MetricBuilder"),
+    "Logger": ("notiq.monitoring.loggers", "Logger"),
+    "Config": ("notiq.config", "Config"),
+    "notiq_task": ("notiq.tasks.queue", "notiq_task"),
+    "notiq_scheduler": ("notiq.tasks.scheduler", "notiq_scheduler"),
+    "notiq_unscheduler": ("notiq.tasks.scheduler", "notiq_unscheduler"),
+    "autodiscover_tasks": ("notiq.utils.dicovery", "autodiscover_tasks"),
+    "celery_app": ("notiq.tasks.worker", "celery_app"),
+    "app": ("notiq.tasks.worker", "celery_app"),
+    "celery": ("notiq.tasks.worker", "celery_app"),
+}
+
+# Names whose first access should trigger environment auto-configuration
+_APP_ALIASES = frozenset({"celery_app", "app", "celery"})
+
+_env_configured = False
+
 
 def _auto_configure_from_env() -> None:
     """
-    Auto-configures Celery from environment variables at module import time.
+    Auto-configures Celery from environment variables on first app access.
 
     This enables the worker process to discover tasks without explicit
-    NotiqConfig() call. Uses the Config class which provides Pydantic
-    validation and automatically loads from .env files.
+    NotiqConfig() call. Plain environment variables are applied via
+    Config.model_construct — Celery only needs the raw strings, so there is
+    no reason to pay Pydantic's URL validation here. Full validation (and
+    .env file parsing) only runs when a .env file is actually present.
 
     Environment Variables (with NOTIQ_ prefix):
         NOTIQ_BROKER_URL: Redis or RabbitMQ broker URL
         NOTIQ_RESULT_BACKEND: Redis result backend URL
         NOTIQ_TASK_DIR: Directory containing custom task modules
     """
+    import os
+
+    from notiq.config import Config, get_settings
+    from notiq.tasks.worker import celery_app
+    from notiq.utils.dicovery import autodiscover_tasks
+
+    broker_url = os.environ.get("NOTIQ_BROKER_URL")
+    result_backend = os.environ.get("NOTIQ_RESULT_BACKEND")
+    task_dir = os.environ.get("NOTIQ_TASK_DIR")
+
+    if os.path.exists(".env"):
+        # A .env file needs pydantic-settings' parser, and its values must
+        # merge with any NOTIQ_* env vars (env vars win) like the baseline
+        # Config() did — so always take the validated path here, even when
+        # some env vars are also set.
+        from pydantic import ValidationError
+
+        try:
+            settings = get_settings()
+        except ValidationError as e:
+            # If validation fails raise exception
+            raise ValueError("Invalid configuration provided") from e
+    elif broker_url is None and result_backend is None and task_dir is None:
+        # Nothing to configure — skip all Pydantic work
+        return
+    else:
+        # Only env vars present: skip URL validation, the worker just
+        # needs the raw strings
+        settings = Config.model_construct(
+            BROKER_URL=broker_url,
+            RESULT_BACKEND=result_backend,
+            TASK_DIR=task_dir,
+        )
+
+    # Collect everything into one dict so Celery's settings machinery (change
+    # notifications, re-computation) runs once instead of per key
+    updates: dict[str, Any] = {}
+
+    if settings.BROKER_URL:
+        updates["broker_url"] = str(settings.BROKER_URL)
+
+    if settings.RESULT_BACKEND:
+        updates["result_backend"] = str(settings.RESULT_BACKEND)
+
+    if settings.TASK_DIR:
+        modules = autodiscover_tasks(settings.TASK_DIR)
+        if modules:
+            # Extend existing includes, don't replace. dict.fromkeys dedupes
+            # while preserving order so repeated configuration (test reloads,
+            # multiple NotiqConfig calls) can't grow the list unbounded;
+            # skip the update entirely when nothing new was discovered.
+            existing = list(celery_app.conf.get("include", []) or [])  # pyright: ignore[reportUnknownArgumentType]
+            new_include = list(dict.fromkeys(existing + modules))
+            if new_include != existing:
+                updates["include"] = new_include
+
+    if updates:
+        celery_app.conf.update(updates)
+
+
+def NotiqConfig(
+    BROKER_URL: str,
+    RESULT_BACKEND: str,
+    task_dir: str | None = None,
+    *,
+    propagate_env: bool = False,
+    preload: bool = False,
+) -> None:
+    """
+    Configures the Notiq library programmatically.
+
+    Validates all inputs with Pydantic and applies them to the current
+    process in a single Celery config update. The validated settings are
+    kept in-process (stashed on celery_app.conf["notiq_settings"]) rather
+    than round-tripped through os.environ, which would mutate shared
+    process state just so pydantic-settings could read it back.
+
+    Args:
+        BROKER_URL: The Redis or RabbitMQ connection string
+            (e.g., 'redis://localhost:6379/0').
+        RESULT_BACKEND: The Redis connection string for storing task results.
+        task_dir: The directory where user tasks are located.
+        propagate_env: If True, also export the NOTIQ_* environment
+            variables so forked/spawned worker processes pick up the same
+            configuration. Off by default to avoid env mutation.
+        preload: If True, import the discovered task modules concurrently
+            now instead of leaving them to Celery's serial import at worker
+            start — overlaps the disk reads on large task directories.
+
+    Raises:
+        ValueError: If BROKER_URL or RESULT_BACKEND are invalid URLs.
+    """
+    import os
+
+    from pydantic import ValidationError
+
+    from notiq.config import Config
+    from notiq.tasks.worker import celery_app
+    from notiq.utils.dicovery import autodiscover_tasks, preload_task_modules
+
+    # Validate using the unified Config class
+    try:
+        valid_settings = Config(
+            BROKER_URL=BROKER_URL,  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+            RESULT_BACKEND=RESULT_BACKEND,  # type: ignore[arg-type]  # pyright: ignore[reportArgumentType]
+            TASK_DIR=task_dir,
+        )
+    except ValidationError as e:
+        raise ValueError(f"Invalid configuration provided: {e}") from e
+
+    updates: dict[str, Any] = {
+        "broker_url": str(valid_settings.BROKER_URL),
+        "result_backend": str(valid_settings.RESULT_BACKEND),
+        # Keep the validated settings reachable in-process
+        "notiq_settings": valid_settings,
+    }
+
+    if valid_settings.TASK_DIR:
+        modules = autodiscover_tasks(valid_settings.TASK_DIR)
+        if modules:
+            # Order-preserving dedup; skip when nothing new was discovered
+            existing = list(celery_app.conf.get("include", []) or [])  # pyright: ignore[reportUnknownArgumentType]
+            new_include = list(dict.fromkeys(existing + modules))
+            if new_include != existing:
+                updates["include"] = new_include
+            if preload:
+                preload_task_modules(modules)
+
+    celery_app.conf.update(updates)
+
+    # Explicit configuration supersedes env auto-configuration
+    global _env_configured
+    _env_configured = True
+
+    if propagate_env:
+        # Opt-in: needed when worker processes are forked/spawned and must
+        # rebuild the same configuration from the environment
+        os.environ["NOTIQ_BROKER_URL"] = str(valid_settings.BROKER_URL)
+        os.environ["NOTIQ_RESULT_BACKEND"] = str(valid_settings.RESULT_BACKEND)
+        if valid_settings.TASK_DIR:
+            os.environ["NOTIQ_TASK_DIR"] = str(valid_settings.TASK_DIR)
+
+
+def __getattr__(name: str) -> Any:
     try:
-        # Config automatically reads from environment and .env file
-        # with NOTIQ_ prefix and validates URLs with Pydantic
-        settings = Config()
+        module_path, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-        if settings.BROKER_URL:
-            celery_app.conf.update(broker_url=str(settings.BROKER_URL))
+    from importlib import import_module
 
-        if settings.RESULT_BACKEND:
-            celery_app.conf.update(result_backend=str(settings.RESULT_BACKEND))
+    value = getattr(import_module(module_path), attr)
+    # Cache so subsequent accesses bypass __getattr__ entirely
+    globals()[name] = value
 
-        if settings.TASK_DIR:
-            modules = autodiscover_tasks(settings.TASK_DIR)
-            if modules:
-                # Extend existing includes, don't replace
-                existing = list(celery_app.conf.get("include", []) or [])  # pyright: ignore[reportUnknownArgumentType]
-                celery_app.conf.update(include=existing + modules)
+    if name in _APP_ALIASES:
+        global _env_configured
+        if not _env_configured:
+            _env_configured = True
+            _auto_configure_from_env()
 
-    except ValidationError as e:
-        # If validation fails raise exception
-        raise ValueError("Invalid configuration provided") from e
-
-
-# Run auto-configuration when the module is imported
-_auto_configure_from_env()
-
-# issue with this. does not work properly
-# NOTE: fix programmatic configuration of worker
-# def NotiqConfig(
-#     BROKER_URL: AmqpDsn | RedisDsn,
-#     RESULT_BACKEND: RedisDsn,
-#     task_dir: str,
-# ) -> None:
-#     """
-#     Configures the Notiq library programmatically.
-
-#     This function validates all inputs using Pydantic and configures the
-#     current process. For production, using a .env file is recommended as
-#     the worker will automatically load configuration from it.
-
-#     Args:
-#         BROKER_URL: The Redis or RabbitMQ connection string
-#             (e.g., 'redis://localhost:6379/0').
-#         RESULT_BACKEND: The Redis connection string for storing task results.
-#         task_dir: The directory where user tasks are located.
-
-#     Note:
-#         For the Celery worker to auto-discover tasks, create a .env file:
-
-#             NOTIQ_BROKER_URL=redis://localhost:6379/0
-#             NOTIQ_RESULT_BACKEND=redis://localhost:6379/0
-#             NOTIQ_TASK_DIR=./tasks
-
-#     Raises:
-#         ValueError: If BROKER_URL or RESULT_BACKEND are invalid URLs.
-#     """
-#     # Validate using the unified Config class
-#     try:
-#         valid_settings = Config(
-#             BROKER_URL=BROKER_URL,
-#             RESULT_BACKEND=RESULT_BACKEND,
-#             TASK_DIR=task_dir,
-#         )
-#     except ValidationError as e:
-#         raise ValueError(f"Invalid configuration provided: {e}") from e
-
-#     # Set environment variables for worker processes to pick up
-#     os.environ["NOTIQ_TASK_DIR"] = str(valid_settings.TASK_DIR)
-#     os.environ["NOTIQ_BROKER_URL"] = str(valid_settings.BROKER_URL)
-#     os.environ["NOTIQ_RESULT_BACKEND"] = str(valid_settings.RESULT_BACKEND)
-
-#     # Apply broker/backend configuration
-#     if valid_settings.BROKER_URL:
-#         celery_app.conf.update(broker_url=str(valid_settings.BROKER_URL))
-#         log.info("Notiq connected to broker at: %s", valid_settings.BROKER_URL)
-
-#     if valid_settings.RESULT_BACKEND:
-#         celery_app.conf.update(result_backend=str(valid_settings.RESULT_BACKEND))
-
-#     # Handle task discovery
-#     if valid_settings.TASK_DIR:
-#         modules = autodiscover_tasks(valid_settings.TASK_DIR)
-
-#         if modules:
-#             existing = list(celery_app.conf.get("include", []) or [])  # pyright: ignore[reportUnknownArgumentType]  # noqa: E501
-#             celery_app.conf.update(include=existing + modules)
-#             log.info(
-#                 "Notiq discovered %d task module(s) in '%s'",
-#                 len(modules),
-#                 valid_settings.TASK_DIR,
-#             )
-#         else:
-#             log.warning("No python task files found in '%s'", valid_settings.TASK_DIR)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
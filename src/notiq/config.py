@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import AmqpDsn, RedisDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,6 +35,9 @@ class Config(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        # Build the pydantic-core schema on first validation rather than at
+        # class definition, so model_construct-only consumers never pay for it
+        defer_build=True,
     )
 
     # Default to Redis for local dev, but easily swappable for RabbitMQ
@@ -40,3 +45,17 @@ class Config(BaseSettings):
     BROKER_URL: AmqpDsn | RedisDsn | None = None
     RESULT_BACKEND: RedisDsn | None = None
     TASK_DIR: str | None = None
+
+
+# maxsize=1 is sufficient since the environment doesn't change mid-process
+@lru_cache(maxsize=1)
+def get_settings() -> Config:
+    """
+    Return the process-wide Config instance, built lazily on first call.
+
+    Caching here avoids re-reading environment variables and re-running
+    Pydantic validation every time settings are needed; callers that want a
+    fresh read (e.g. tests mutating the environment) can call
+    get_settings.cache_clear() first.
+    """
+    return Config()
@@ -30,6 +30,21 @@ class MetricBuilder:
         registry: CollectorRegistry | None - the registry to use
     """
 
+    # Builders are created per metric per module; slots drop the per-instance
+    # __dict__ (~200 bytes each) and make attribute access a descriptor load
+    __slots__ = (
+        "name",
+        "documentation",
+        "labelnames",
+        "namespace",
+        "subsystem",
+        "unit",
+        "registry",
+        "_collectors",
+        "_full_name",
+        "_base_kwargs",
+    )
+
     def __init__(
         self,
         name: str,
@@ -49,31 +64,44 @@ class MetricBuilder:
         # Default to the global registry if None is passed
         self.registry = registry if registry is not None else REGISTRY
 
+        # Resolve the registry's name->collector mapping once. It's a private
+        # attribute the library mutates in place, so holding a reference is
+        # safe and spares a getattr on every _get_or_create call.
+        self._collectors: dict[str, Any] = getattr(
+            self.registry, "_names_to_collectors", {}
+        )
+        # All inputs are immutable, so the full name can be computed up front
+        self._full_name: str = "_".join(
+            p for p in (self.namespace, self.subsystem, self.name) if p
+        )
+        # Every factory method passes the same kwargs; build the dict once
+        self._base_kwargs: dict[str, Any] = {
+            "name": self.name,
+            "documentation": self.documentation,
+            "labelnames": self.labelnames,
+            "namespace": self.namespace,
+            "subsystem": self.subsystem,
+            "unit": self.unit,
+            "registry": self.registry,
+        }
+
     def _get_full_name(self) -> str:
         """Helper to generate the final prometheus name."""
-        parts = [self.namespace, self.subsystem, self.name]
-        return "_".join(p for p in parts if p)
+        return self._full_name
 
     def _get_or_create(self, metric_cls: type[M], **kwargs: Any) -> M:
         """
         Safely retrieves a metric from the registry or creates a new one.
         Uses Generics (Type[M]) to ensure the return type matches the input class.
         """
-        full_name = self._get_full_name()
-
-        # Check if the metric already exists in the registry.
-        # NOTE: We access the private '_names_to_collectors' to avoid crashing.
-        # We use getattr to safely access it without angering the linter too much,
-        # but for Mypy strict mode, we must suppress the attribute error explicitly
-        # because the library does not expose this publicly.
+        full_name = self._full_name
 
-        # We assume self.registry is never None because of the __init__ logic
-        existing_collectors = getattr(self.registry, "_names_to_collectors", {})
-
-        if full_name in existing_collectors:
+        # Check if the metric already exists in the registry, using the
+        # mapping resolved in __init__ (the library mutates it in place).
+        if full_name in self._collectors:
             # if found, we must cast it to type 'M' because Python
             # doesn't know for sure if the stored object matches 'metric_cls'.
-            return cast(M, existing_collectors[full_name])
+            return cast(M, self._collectors[full_name])
 
         # If not found, create a new one with thread-safety.
         try:
@@ -82,8 +110,7 @@ class MetricBuilder:
         except ValueError:
             # Handle duplicate registration under race conditions
             # retry lookup before failing.
-            existing_collectors = getattr(self.registry, "_names_to_collectors", {})
-            existing = existing_collectors.get(full_name)
+            existing = self._collectors.get(full_name)
             if existing is None:
                 raise ValueError(f"Metric '{full_name}' already exists.") from None
             return cast(M, existing)
@@ -91,58 +118,21 @@ class MetricBuilder:
     # prometheus counter metric
     def counter(self) -> Counter:
         """Create a counter metric."""
-        return self._get_or_create(
-            Counter,
-            name=self.name,
-            documentation=self.documentation,
-            labelnames=self.labelnames,
-            namespace=self.namespace,
-            subsystem=self.subsystem,
-            unit=self.unit,
-            registry=self.registry,
-        )
+        return self._get_or_create(Counter, **self._base_kwargs)
 
     # prometheus gauge metric
     def gauge(self) -> Gauge:
         """Create a gauge metric."""
-        return self._get_or_create(
-            Gauge,
-            name=self.name,
-            documentation=self.documentation,
-            labelnames=self.labelnames,
-            namespace=self.namespace,
-            subsystem=self.subsystem,
-            unit=self.unit,
-            registry=self.registry,
-        )
+        return self._get_or_create(Gauge, **self._base_kwargs)
 
     # prometheus histogram metric
     def histogram(
         self, buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS
     ) -> Histogram:
         """Create a histogram metric."""
-        return self._get_or_create(
-            Histogram,
-            name=self.name,
-            documentation=self.documentation,
-            labelnames=self.labelnames,
-            namespace=self.namespace,
-            subsystem=self.subsystem,
-            unit=self.unit,
-            registry=self.registry,
-            buckets=buckets,
-        )
+        return self._get_or_create(Histogram, **self._base_kwargs, buckets=buckets)
 
     # prometheus summary metric
     def summary(self) -> Summary:
         """Create a summary metric."""
-        return self._get_or_create(
-            Summary,
-            name=self.name,
-            documentation=self.documentation,
-            labelnames=self.labelnames,
-            namespace=self.namespace,
-            subsystem=self.subsystem,
-            unit=self.unit,
-            registry=self.registry,
-        )
+        return self._get_or_create(Summary, **self._base_kwargs)
@@ -1,6 +1,10 @@
 import asyncio
+import atexit
 import functools
 import inspect
+import logging
+import sys
+import threading
 import time
 import warnings
 from collections.abc import Callable
@@ -13,12 +17,370 @@ from notiq.monitoring.validation import validate_metric_name
 P = ParamSpec("P")  # captures the parameters of the user's function (args/kwargs)
 R = TypeVar("R")  # captures the return type of the user's function
 
+# Loggers are shared across decoration sites with the same configuration so
+# re-decorating (module reloads, worker forks, several functions monitored
+# under one metric_name) doesn't set up duplicate handlers or re-walk the
+# handler list.
+_logger_cache: dict[tuple[str, bool, bool], logging.Logger] = {}
+
+# Code-object flags for classifying functions at decoration time. A single
+# int-and on func.__code__.co_flags replaces the attribute-lookup chains
+# inside inspect.is*function, which adds up when @monitor is applied to many
+# functions at import.
+_GENERATOR_FLAGS = inspect.CO_GENERATOR | inspect.CO_ASYNC_GENERATOR
+
+
+# --- Batched metric recording (opt-in via monitor(batch=True)) ---
+# Hot monitored functions pay a mutex acquisition per Prometheus update.
+# Batch mode accumulates counts/latencies in a plain per-thread dict (no
+# locks on the hot path) and replays them into the real metrics at a fixed
+# interval, reducing mutex traffic from O(calls) to O(flushes).
+
+# Seconds between background flushes of accumulated metric updates
+_FLUSH_INTERVAL = 0.5
+
+# Indices into a per-metric accumulator entry
+_SUCCESS, _ERROR, _CANCELLED, _LATENCIES = 0, 1, 2, 3
+
+# Pre-resolved label children per metric_name so the flusher can replay
+# accumulated values without re-resolving labels.
+_batch_children: dict[str, tuple[Any, Any, Any, Any]] = {}
+
+# Each thread owns a one-element "holder" list wrapping its accumulator dict.
+# The flusher swaps holder[0] with a fresh dict (ping-pong) so writers never
+# contend with the drain.
+_batch_local = threading.local()
+_batch_holders: list[list[dict[str, list[Any]]]] = []
+_batch_lock = threading.Lock()  # guards holder registration + flusher startup
+_flusher_started = False
+
+
+def _batch_entry(metric_name: str) -> list[Any]:
+    """Return this thread's accumulator entry for metric_name (lock-free)."""
+    holder: list[dict[str, list[Any]]] | None = getattr(_batch_local, "holder", None)
+    if holder is None:
+        holder = _batch_local.holder = [{}]
+        with _batch_lock:
+            _batch_holders.append(holder)
+    acc = holder[0]
+    entry = acc.get(metric_name)
+    if entry is None:
+        entry = acc[metric_name] = [0, 0, 0, []]
+    return entry
+
+
+def flush_batched_metrics() -> None:
+    """
+    Drain every thread's accumulator into the real Prometheus metrics.
+
+    Runs periodically on a background thread and once at interpreter exit.
+    Safe to call manually (e.g. from tests) to force pending updates out.
+    """
+    for holder in list(_batch_holders):
+        # Ping-pong swap: writers move to the fresh dict, we drain the old one.
+        # A writer that loaded the old dict just before the swap may still
+        # insert into it, so snapshot the items before iterating.
+        drained, holder[0] = holder[0], {}
+        for name, entry in list(drained.items()):
+            success_ctr, error_ctr, cancelled_ctr, latency_obs = _batch_children[name]
+            if entry[_SUCCESS]:
+                success_ctr.inc(entry[_SUCCESS])
+            if entry[_ERROR]:
+                error_ctr.inc(entry[_ERROR])
+            if entry[_CANCELLED]:
+                cancelled_ctr.inc(entry[_CANCELLED])
+            for duration in entry[_LATENCIES]:
+                latency_obs.observe(duration)
+
+
+def _flush_loop() -> None:
+    """Background loop that flushes accumulated metrics every interval."""
+    while True:
+        time.sleep(_FLUSH_INTERVAL)
+        try:
+            flush_batched_metrics()
+        except Exception:
+            # Keep the daemon alive: one bad flush must not silently stop
+            # every subsequent batched update for the process lifetime.
+            logging.getLogger(__name__).exception("batched metric flush failed")
+
+
+def _ensure_flusher() -> None:
+    """Start the background flusher thread once (thread-safe, idempotent)."""
+    global _flusher_started
+    if _flusher_started:
+        return
+    with _batch_lock:
+        if _flusher_started:
+            return
+        threading.Thread(
+            target=_flush_loop, name="notiq-metrics-flush", daemon=True
+        ).start()
+        # Final flush so short-lived processes don't lose pending updates
+        atexit.register(flush_batched_metrics)
+        _flusher_started = True
+
+
+# --- Specialized wrapper codegen ---
+# The generic wrapper re-tests `log_calls` / `batch` and re-resolves names on
+# every call even though they are fixed at decoration time. Instead we build
+# a wrapper source string that hardcodes those decisions and exec it against
+# pre-resolved bindings (metric children, logger, perf_counter), so the hot
+# path is only the work that actually has to happen.
+
+
+def _build_wrapper_source(
+    is_coro: bool,
+    log_calls: bool,
+    batch: bool,
+    info_enabled: bool,
+    error_enabled: bool,
+) -> str:
+    """Build wrapper source specialized for one decoration configuration.
+
+    info_enabled / error_enabled reflect the logger's effective level at
+    decoration time: disabled log statements (and their get_log_context()
+    dict allocations) are omitted from the generated source entirely.
+    """
+    define = "async def" if is_coro else "def"
+    call = "await func" if is_coro else "func"
+    # perf_counter_ns is read from the wrapper's globals (the exec
+    # namespace) so the signature stays a fully transparent (*args,
+    # **kwargs) — a keyword-only default would swallow any caller kwarg
+    # with the same name. The ns->seconds conversion happens once at
+    # observe time, avoiding float arithmetic on the clock reads.
+    lines = [
+        f"{define} wrapper(*args, **kwargs):",
+        "    start_ns = perf_counter_ns()",
+        "    try:",
+    ]
+    if log_calls and info_enabled:
+        lines.append(
+            '        log.info("started func execution", extra=get_log_context())'
+        )
+    lines.append(f"        result = {call}(*args, **kwargs)")
+    if log_calls and info_enabled:
+        lines.append(
+            '        log.info("func successfully ran", extra=get_log_context())'
+        )
+    if batch:
+        lines.append("        batch_entry(metric_name)[SUCCESS] += 1")
+    else:
+        lines.append("        success_ctr.inc()")
+    lines.append("        return result")
+    if is_coro:
+        # Task cancellation is not an error — count it separately
+        lines.append("    except CancelledError:")
+        if info_enabled:
+            lines.append('        log.info("task cancelled", extra=get_log_context())')
+        if batch:
+            lines.append("        batch_entry(metric_name)[CANCELLED] += 1")
+        else:
+            lines.append("        cancelled_ctr.inc()")
+        lines.append("        raise")
+    lines.append("    except Exception:")
+    if error_enabled:
+        lines.append(
+            '        log.exception("error occurred", exc_info=True,'
+            " extra=get_log_context())"
+        )
+    if batch:
+        lines.append("        batch_entry(metric_name)[ERROR] += 1")
+    else:
+        lines.append("        error_ctr.inc()")
+    lines.append("        raise")
+    lines.append("    finally:")
+    if batch:
+        lines.append(
+            "        batch_entry(metric_name)[LATENCIES]"
+            ".append((perf_counter_ns() - start_ns) * 1e-9)"
+        )
+    else:
+        lines.append(
+            "        latency_obs.observe((perf_counter_ns() - start_ns) * 1e-9)"
+        )
+    return "\n".join(lines)
+
+
+@functools.cache
+def _wrapper_code(
+    is_coro: bool,
+    log_calls: bool,
+    batch: bool,
+    info_enabled: bool,
+    error_enabled: bool,
+) -> Any:
+    """Compile (and cache) the wrapper code object for one configuration."""
+    return compile(
+        _build_wrapper_source(is_coro, log_calls, batch, info_enabled, error_enabled),
+        "<notiq-monitor-wrapper>",
+        "exec",
+    )
+
+
+def _make_wrapper(
+    func: Callable[P, R],
+    *,
+    is_coro: bool,
+    log_calls: bool,
+    batch: bool,
+    log: logging.Logger,
+    metric_name: str,
+    success_ctr: Any,
+    error_ctr: Any,
+    cancelled_ctr: Any,
+    latency_obs: Any,
+) -> Callable[P, R]:
+    """Exec a specialized wrapper for func against pre-resolved bindings."""
+    namespace: dict[str, Any] = {
+        "func": func,
+        "perf_counter_ns": time.perf_counter_ns,
+        "log": log,
+        "get_log_context": get_log_context,
+        "success_ctr": success_ctr,
+        "error_ctr": error_ctr,
+        "cancelled_ctr": cancelled_ctr,
+        "latency_obs": latency_obs,
+        "CancelledError": asyncio.CancelledError,
+        "batch_entry": _batch_entry,
+        "metric_name": metric_name,
+        "SUCCESS": _SUCCESS,
+        "ERROR": _ERROR,
+        "CANCELLED": _CANCELLED,
+        "LATENCIES": _LATENCIES,
+    }
+    # Capture the logger's effective level once; the standard-logging
+    # fast-path check moves from per-call to per-decoration. Level changes
+    # made after decoration won't re-enable the omitted statements.
+    info_enabled = log.isEnabledFor(logging.INFO)
+    error_enabled = log.isEnabledFor(logging.ERROR)
+    exec(
+        _wrapper_code(is_coro, log_calls, batch, info_enabled, error_enabled),
+        namespace,
+    )
+    wrapper = namespace["wrapper"]
+    # Minimal metadata wiring: functools.wraps copies five attributes and
+    # merges __dict__ per decoration, which adds up when thousands of
+    # functions are monitored at import. __wrapped__/__name__/__qualname__
+    # cover introspection, tracebacks, and functools.unwrap. Like
+    # functools.update_wrapper, tolerate callables without these attributes
+    # (e.g. functools.partial).
+    wrapper.__wrapped__ = func
+    for attr in ("__name__", "__qualname__"):
+        try:
+            setattr(wrapper, attr, getattr(func, attr))
+        except AttributeError:
+            pass
+    return cast(Callable[P, R], wrapper)
+
+
+def _make_sync_wrapper(func: Callable[P, R], **site: Any) -> Callable[P, R]:
+    """Build the monitoring wrapper for a plain (sync) function."""
+    return _make_wrapper(func, is_coro=False, **site)
+
+
+def _make_async_wrapper(func: Callable[P, R], **site: Any) -> Callable[P, R]:
+    """Build the monitoring wrapper for a coroutine function."""
+    return _make_wrapper(func, is_coro=True, **site)
+
+
+def _monitor_impl(
+    metric_name: str,
+    file_output: bool,
+    json_serialize: bool,
+    log_calls: bool,
+    batch: bool,
+    is_coro: bool | None,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Shared implementation behind monitor / monitor_sync / monitor_async.
+
+    is_coro=None auto-detects per function; True/False skips detection
+    entirely for callers that already know what they are decorating.
+    """
+    # Validate metric_name early to prevent cardinality attacks
+    validate_metric_name(metric_name)
+
+    # Intern the name so downstream dict/label hashes are pointer-compares
+    metric_name = sys.intern(metric_name)
+
+    # Resolve label children once at decoration time. `.labels()` takes the
+    # metric's lock and does a dict lookup on the label tuple, so calling it
+    # on every invocation is pure hot-path overhead — metric_name is fixed
+    # here, so the children can be pre-bound instead.
+    success_ctr = REQUEST_COUNT.labels(function_name=metric_name, status="success")
+    error_ctr = REQUEST_COUNT.labels(function_name=metric_name, status="error")
+    cancelled_ctr = REQUEST_COUNT.labels(function_name=metric_name, status="cancelled")
+    latency_obs = REQUEST_LATENCY.labels(function_name=metric_name)
+
+    if batch:
+        # Register children for the flusher and make sure it is running
+        _batch_children[metric_name] = (
+            success_ctr,
+            error_ctr,
+            cancelled_ctr,
+            latency_obs,
+        )
+        _ensure_flusher()
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        if is_coro is None:
+            # Classify via code flags; fall back to inspect for exotic
+            # callables (e.g. functools.partial) with no __code__ of their own.
+            code = getattr(func, "__code__", None)
+            if code is not None:
+                code_flags: int = code.co_flags
+                is_generator = bool(code_flags & _GENERATOR_FLAGS)
+                coro = bool(code_flags & inspect.CO_COROUTINE)
+            else:
+                is_generator = inspect.isgeneratorfunction(
+                    func
+                ) or inspect.isasyncgenfunction(func)
+                coro = inspect.iscoroutinefunction(func)
+
+            # Warn if decorating a generator function (timing is misleading)
+            if is_generator:
+                func_name = getattr(func, "__name__", repr(func))
+                warnings.warn(
+                    f"@monitor applied to generator function '{func_name}'. "
+                    "Timing will only capture generator creation, not iteration. "
+                    "Consider monitoring the consuming code instead.",
+                    UserWarning,
+                    stacklevel=2,
+                )
+        else:
+            coro = is_coro
+
+        # Initialize logger instance (shared across identical decoration sites)
+        logger_key = (metric_name, file_output, json_serialize)
+        log = _logger_cache.get(logger_key)
+        if log is None:
+            log = _logger_cache[logger_key] = Logger(
+                metric_name, file_output=file_output, json_serialize=json_serialize
+            ).setup()
+
+        make = _make_async_wrapper if coro else _make_sync_wrapper
+        return make(
+            func,
+            log_calls=log_calls,
+            batch=batch,
+            log=log,
+            metric_name=metric_name,
+            success_ctr=success_ctr,
+            error_ctr=error_ctr,
+            cancelled_ctr=cancelled_ctr,
+            latency_obs=latency_obs,
+        )
+
+    return decorator
+
 
 def monitor(
     metric_name: str,
     file_output: bool = False,
     json_serialize: bool = True,
     log_calls: bool = True,
+    batch: bool = False,
 ) -> Callable[[Callable[P, R]], Callable[P, R]]:
     """
     A decorator to measure the execution time of a function.
@@ -31,6 +393,10 @@ def monitor(
         json_serialize: Controls serializing log output for log file.
         log_calls: If True, logs start/end of each function call. Set to False
             for high-frequency functions to reduce logging overhead.
+        batch: If True, metric updates are accumulated per-thread and flushed
+            to Prometheus every ~500ms instead of on every call. Use for very
+            hot functions where the metric mutex dominates wrapper cost.
+            Updates may lag by up to the flush interval.
 
     Raises:
         ValueError: If metric_name doesn't match Prometheus naming conventions.
@@ -40,6 +406,10 @@ def monitor(
         The decorator will issue a warning if applied to such functions,
         as timing will only capture generator creation, not iteration.
 
+        Log statements are specialized against the logger's effective level
+        at decoration time; changing the level afterwards does not affect
+        functions that are already decorated.
+
     Example:
         from notiq.monitoring.decorators import monitor
         from notiq.monitoring.loggers import log_context
@@ -52,94 +422,42 @@ def monitor(
         with log_context(correlation_id="abc-123", user_id=456):
             await process_payment(100.0)
     """
-    # Validate metric_name early to prevent cardinality attacks
-    validate_metric_name(metric_name)
+    return _monitor_impl(
+        metric_name, file_output, json_serialize, log_calls, batch, is_coro=None
+    )
 
-    def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        # Warn if decorating a generator function (timing would be misleading)
-        if inspect.isgeneratorfunction(func) or inspect.isasyncgenfunction(func):
-            warnings.warn(
-                f"@monitor applied to generator function '{func.__name__}'. "
-                "Timing will only capture generator creation, not iteration. "
-                "Consider monitoring the consuming code instead.",
-                UserWarning,
-                stacklevel=2,
-            )
-
-        # Initialize logger instance
-        log = Logger(
-            metric_name, file_output=file_output, json_serialize=json_serialize
-        ).setup()
-
-        # Handle async functions
-        if inspect.iscoroutinefunction(func):
-
-            @functools.wraps(func)  # captures wrapped async func/method metadata
-            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
-                start_time: float = time.perf_counter()
-                try:
-                    if log_calls:
-                        log.info("started func execution", extra=get_log_context())
-                    # Execute the user async function
-                    result = await func(*args, **kwargs)
-                    if log_calls:
-                        log.info("func successfully ran", extra=get_log_context())
-
-                    # Record Success
-                    REQUEST_COUNT.labels(
-                        function_name=metric_name, status="success"
-                    ).inc()
-
-                    return result
-                except asyncio.CancelledError:
-                    # Handle task cancellation separately (not an error)
-                    log.info("task cancelled", extra=get_log_context())
-                    REQUEST_COUNT.labels(
-                        function_name=metric_name, status="cancelled"
-                    ).inc()
-                    raise  # Re-raise to propagate cancellation
-                except Exception:
-                    # Record Failure
-                    log.exception(
-                        "error occurred", exc_info=True, extra=get_log_context()
-                    )
-                    REQUEST_COUNT.labels(
-                        function_name=metric_name, status="error"
-                    ).inc()
-                    raise  # Re-raise to preserve traceback
-                finally:
-                    duration: float = time.perf_counter() - start_time
-                    # Latency metric
-                    REQUEST_LATENCY.labels(function_name=metric_name).observe(duration)
-
-            return cast(Callable[P, R], async_wrapper)
-
-        # Handle sync functions
-        @functools.wraps(func)  # captures wrapped func/method metadata
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
-            start_time: float = time.perf_counter()
-            try:
-                if log_calls:
-                    log.info("started func execution", extra=get_log_context())
-                # Execute the user sync function
-                result = func(*args, **kwargs)
-                if log_calls:
-                    log.info("func successfully ran", extra=get_log_context())
-
-                # Record Success
-                REQUEST_COUNT.labels(function_name=metric_name, status="success").inc()
-
-                return result
-            except Exception:
-                # Record Failure
-                log.exception("error occurred", exc_info=True, extra=get_log_context())
-                REQUEST_COUNT.labels(function_name=metric_name, status="error").inc()
-                raise  # Re-raise to preserve traceback
-            finally:
-                duration: float = time.perf_counter() - start_time
-                # Latency metric
-                REQUEST_LATENCY.labels(function_name=metric_name).observe(duration)
-
-        return wrapper
 
-    return decorator
+def monitor_sync(
+    metric_name: str,
+    file_output: bool = False,
+    json_serialize: bool = True,
+    log_calls: bool = True,
+    batch: bool = False,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Variant of monitor specialized for plain (sync) functions.
+
+    Skips the per-function sync/async classification — use when decorating
+    many functions at import time and the kind is already known.
+    """
+    return _monitor_impl(
+        metric_name, file_output, json_serialize, log_calls, batch, is_coro=False
+    )
+
+
+def monitor_async(
+    metric_name: str,
+    file_output: bool = False,
+    json_serialize: bool = True,
+    log_calls: bool = True,
+    batch: bool = False,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Variant of monitor specialized for coroutine functions.
+
+    Skips the per-function sync/async classification — use when decorating
+    many functions at import time and the kind is already known.
+    """
+    return _monitor_impl(
+        metric_name, file_output, json_serialize, log_calls, batch, is_coro=True
+    )
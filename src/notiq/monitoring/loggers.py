@@ -1,30 +1,101 @@
-import datetime
+import atexit
+import copy
+import io
 import json
 import logging
+import os
+import queue
 import socket
 import sys
 import threading
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from contextvars import ContextVar
 from functools import lru_cache
-from logging.handlers import RotatingFileHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    WatchedFileHandler,
+)
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from notiq.monitoring.validation import sanitize_log_filename
 
+# orjson serializes small dicts ~5x faster than stdlib json; it's an
+# optional dependency (install notiq[speedups]) so fall back gracefully.
+# The handler API wants str, hence the decode of orjson's bytes output.
+try:
+    import orjson
+
+    def _dumps(obj: dict[str, Any]) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _dumps(obj: dict[str, Any]) -> str:
+        return json.dumps(obj)
+
 
 # maxsize=1 is sufficient since the system hostname rarely changes
 @lru_cache(maxsize=1)
 def get_cached_system_hostname() -> str:
-    """Returns the local system hostname, cached for efficiency."""
-    return socket.gethostname()
+    """Returns the local system hostname, cached and interned: the same
+    string lands in every JSON record, so interning lets dict machinery
+    and the serializer compare it by pointer."""
+    return sys.intern(socket.gethostname())
+
+
+# Re-register the standard level names as interned strings so the
+# levelname on every record is a shared object rather than content-hashed
+# anew per emit. Marginal per record, but it recurs on every log line.
+for _level_name in ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "NOTSET"):
+    logging.addLevelName(logging.getLevelName(_level_name), sys.intern(_level_name))
+del _level_name
+
+
+# Cache of (epoch_second, "YYYY-MM-DDTHH:MM:SS") shared by all formatters.
+# Bursty logging emits many records within the same second, so the prefix
+# is computed once per second and only the microsecond suffix per record.
+# Unguarded by design: the worst a write race can do is recompute the same
+# prefix twice, same tradeoff as the hostname cache below.
+_ts_cache: tuple[int, str] = (0, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a LogRecord.created epoch float as an ISO-8601 UTC string."""
+    global _ts_cache
+    sec = int(created)
+    cached = _ts_cache
+    if cached[0] == sec:
+        prefix = cached[1]
+    else:
+        # gmtime + strftime run entirely in C — no datetime/tzinfo objects
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _ts_cache = (sec, prefix)
+    return f"{prefix}.{int((created - sec) * 1_000_000):06d}+00:00"
+
+
+def _record_message(record: logging.LogRecord) -> str:
+    """Resolve a record's final message, skipping getMessage() when there
+    is nothing to interpolate — getMessage always runs str(msg) % args,
+    and most modern call sites pass a pre-formatted f-string with no args.
+    """
+    if record.args or not isinstance(record.msg, str):
+        return record.getMessage()
+    return record.msg
 
 
 # Thread lock for safe handler setup
 _setup_lock = threading.Lock()
 
+# Logger names already configured, mapped to whether a file handler was set
+# up. Lets setup() return without taking the lock or re-scanning the
+# handler list on repeated calls (double-checked locking).
+_configured: dict[str, bool] = {}
+
 # Context variable for dynamic log context (thread/async-safe)
 # Note: We use None as default and handle empty dict in accessors
 # to avoid mutable default
@@ -126,8 +197,30 @@ class JsonFormatter(logging.Formatter):
         "taskName",
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Constant for the life of the process: resolve once at formatter
+        # init instead of a cache lookup / record attribute read per record
+        self._hostname: str = get_cached_system_hostname()
+        self._pid: int = os.getpid()
+        # Fixed-schema template cloned per record: dict.copy() is one
+        # C-level allocation at the final size, cheaper than growing a
+        # fresh literal, and the constant fields are already filled in.
+        self._record_template: dict[str, Any] = {
+            "timestamp": "",
+            "name": "",
+            "level": "",
+            "message": "",
+            "module": "",
+            "line": 0,
+            "process_id": self._pid,
+            "thread_name": "",
+            "hostname": self._hostname,
+            "context": {},
+        }
+
     def format(self, record: logging.LogRecord) -> str:
-        record.message = record.getMessage()
+        record.message = _record_message(record)
         # Extract dynamic extras
         extras = {
             key: value
@@ -135,27 +228,81 @@ class JsonFormatter(logging.Formatter):
             if key not in self.RESERVED_ATTRS
         }
 
-        # log record format
-        log_record = {
-            "timestamp": datetime.datetime.fromtimestamp(
-                record.created,
-                tz=datetime.UTC,  # pyright: ignore[reportUnknownArgumentType, reportAttributeAccessIssue]
-            ).isoformat(),
-            "name": record.name,
-            "level": record.levelname,
-            "message": record.getMessage(),
-            "module": record.module,
-            "line": record.lineno,
-            # Contextual data for production observability
-            "process_id": record.process,
-            "thread_name": record.threadName,
-            "hostname": get_cached_system_hostname(),
-            "context": extras,
-        }
+        # log record format: clone the prebuilt template and fill in the
+        # per-record fields (process_id/hostname are already baked in)
+        log_record = self._record_template.copy()
+        log_record["timestamp"] = _format_timestamp(record.created)
+        log_record["name"] = record.name
+        log_record["level"] = record.levelname
+        log_record["message"] = record.message
+        log_record["module"] = record.module
+        log_record["line"] = record.lineno
+        # Contextual data for production observability
+        log_record["thread_name"] = record.threadName
+        log_record["context"] = extras
         if record.exc_info:
             log_record["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_record)
+        return _dumps(log_record)
+
+
+class _LogQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock prepare() runs self.format(record) on the caller thread and
+    drops exc_info, which would rob the listener-side JsonFormatter of the
+    exception. The queue is in-process (no pickling), so we only resolve
+    the message on a shallow copy and keep everything else intact.
+
+    The caller thread therefore pays only %-interpolation plus a queue
+    push; JSON serialization (JsonFormatter + orjson/json dumps) runs
+    exclusively on the single listener thread, amortized off the hot path.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = _record_message(record)
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def _stop_queue_listener(listener: QueueListener) -> None:
+    """Stop a listener if it is still running (atexit may fire after a
+    manual stop, and QueueListener.stop is not idempotent)."""
+    if getattr(listener, "_thread", None) is not None:
+        listener.stop()
+
+
+# Shared line-buffered stdout wrapper; module-level so it stays alive for
+# the life of the process (a garbage-collected TextIOWrapper would close
+# the underlying stdout buffer with it).
+_console_wrapper: io.TextIOWrapper | None = None
+
+
+def _console_stream() -> Any:
+    """
+    Return the stream console handlers should write to.
+
+    logging.StreamHandler issues two write() calls per record (message,
+    then terminator); wrapping the real stdout in a line-buffered
+    TextIOWrapper coalesces them in userspace so the kernel sees one
+    write per line. Only the real stdout is wrapped — replaced streams
+    (pytest capture, contextlib.redirect_stdout) are returned as-is
+    since they may not expose a .buffer and capture would break.
+    """
+    global _console_wrapper
+    if sys.stdout is not sys.__stdout__ or sys.stdout is None:
+        return sys.stdout
+    if _console_wrapper is None:
+        _console_wrapper = io.TextIOWrapper(
+            sys.stdout.buffer,
+            encoding="utf-8",
+            line_buffering=True,
+            write_through=False,
+        )
+    return _console_wrapper
 
 
 class Logger:
@@ -168,6 +315,16 @@ class Logger:
         level (int): The logging level (e.g., logging.DEBUG, logging.INFO). defaults to logging.DEBUG.
         file_output (bool): Whether to enable file logging. defaults to False.
         json_serialize (bool): Whether to use JSON format for file logs. defaults to True.
+        rotation (str): File rotation strategy. defaults to "size".
+            - "size": in-process RotatingFileHandler (5MB, 3 backups). The
+              rename cascade at each boundary runs on the listener thread.
+            - "external": WatchedFileHandler — rotation is delegated to an
+              external tool like logrotate, so the process never pays the
+              rotation stall; it just reopens the file after a move.
+            - "concurrent": ConcurrentRotatingFileHandler from the optional
+              concurrent-log-handler package; copy-truncate rotation that is
+              safe with multiple worker processes sharing one log file.
+              Falls back to "size" if the package is not installed.
 
     Returns:
         Configured logger instance.
@@ -180,6 +337,7 @@ class Logger:
         level: int = logging.DEBUG,
         file_output: bool = False,
         json_serialize: bool = True,
+        rotation: Literal["size", "external", "concurrent"] = "size",
     ):
         self.logger_name = logger_name
         self.logger: logging.Logger = logging.getLogger(logger_name)
@@ -187,6 +345,7 @@ class Logger:
         self.level: int = level
         self.file_output: bool = file_output
         self.json_serialize: bool = json_serialize
+        self.rotation: Literal["size", "external", "concurrent"] = rotation
 
         # --- Create the Logger instance ---
         self.logger.setLevel(self.level)
@@ -196,9 +355,19 @@ class Logger:
         Configure logger handlers in a thread-safe manner.
         Idempotent: safe to call multiple times.
         """
+        # Fast path: already configured (with a file handler if we need one)
+        state = _configured.get(self.logger_name)
+        if state is not None and (state or not self.file_output):
+            return self.logger
+
         # Thread-safe handler setup to prevent race conditions
         with _setup_lock:
-            return self._setup_handlers()
+            # Re-check under the lock; another thread may have configured it
+            state = _configured.get(self.logger_name)
+            if state is None or (self.file_output and not state):
+                self._setup_handlers()
+                _configured[self.logger_name] = bool(state) or self.file_output
+            return self.logger
 
     def _setup_handlers(self) -> logging.Logger:
         """Internal method to configure handlers (called under lock)."""
@@ -208,11 +377,11 @@ class Logger:
             and not isinstance(h, RotatingFileHandler)
             for h in self.logger.handlers
         )
-        has_file = any(isinstance(h, RotatingFileHandler) for h in self.logger.handlers)
+        has_file = any(isinstance(h, _LogQueueHandler) for h in self.logger.handlers)
 
         # --- Console Handler ---
         if not has_console:
-            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler = logging.StreamHandler(_console_stream())
             console_formatter = logging.Formatter(
                 "%(asctime)s - %(levelname)s - %(message)s", datefmt="%H:%M:%S"
             )
@@ -229,6 +398,31 @@ class Logger:
 
         return self.logger
 
+    def _make_file_handler(self, file_path: Path) -> logging.FileHandler:
+        """Create the disk-writing handler for the configured rotation mode."""
+        if self.rotation == "external":
+            # Rotation handled by logrotate etc.; the handler only reopens
+            # the file when it notices the inode changed
+            return WatchedFileHandler(file_path)
+
+        if self.rotation == "concurrent":
+            try:
+                from concurrent_log_handler import (  # pyright: ignore[reportMissingImports]
+                    ConcurrentRotatingFileHandler,
+                )
+
+                return ConcurrentRotatingFileHandler(  # type: ignore[no-any-return]  # pyright: ignore[reportUnknownVariableType]
+                    file_path, maxBytes=5 * 1024 * 1024, backupCount=3
+                )
+            except ImportError:
+                sys.stderr.write(
+                    "[Logger] concurrent-log-handler is not installed; "
+                    "falling back to size-based rotation.\n"
+                )
+
+        # File Handler with rotation (5MB, 3 backups)
+        return RotatingFileHandler(file_path, maxBytes=5 * 1024 * 1024, backupCount=3)
+
     def _setup_file_handler(self) -> None:
         """
         Set up file handler with proper error handling.
@@ -242,10 +436,7 @@ class Logger:
             safe_filename = sanitize_log_filename(self.logger_name)
             file_path = self.log_dir / f"{safe_filename}.log"
 
-            # File Handler with rotation (5MB, 3 backups)
-            file_handler = RotatingFileHandler(
-                file_path, maxBytes=5 * 1024 * 1024, backupCount=3
-            )
+            file_handler = self._make_file_handler(file_path)
 
             # Choose formatter based on json_serialize setting
             if self.json_serialize:
@@ -258,7 +449,23 @@ class Logger:
 
             file_handler.setFormatter(formatter)
             file_handler.setLevel(self.level)
-            self.logger.addHandler(file_handler)
+
+            # Move disk writes (and rotation stalls) off the caller thread:
+            # emitting becomes a queue push, a single background thread
+            # drains the queue into the rotating file handler.
+            log_queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+            listener = QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            listener.start()
+            atexit.register(_stop_queue_listener, listener)
+
+            queue_handler = _LogQueueHandler(log_queue)
+            # Keep the listener reachable from the handler (same convention
+            # as logging.config) so callers/tests can stop or inspect it
+            queue_handler.listener = listener  # type: ignore[attr-defined]
+            queue_handler.setLevel(self.level)
+            self.logger.addHandler(queue_handler)
 
         except PermissionError:
             # Log to stderr but don't crash the application
@@ -7,13 +7,32 @@ Provides sanitization and validation functions to prevent:
 """
 
 import re
+import string
+from functools import lru_cache
 from pathlib import Path
 
-# Regex for valid Prometheus metric/label names
-# Must start with [a-zA-Z_], contain only [a-zA-Z0-9_], max 64 chars
-VALID_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]{0,63}$")
-
-
+# Character sets for valid Prometheus metric/label names: must start with
+# [a-zA-Z_], contain only [a-zA-Z0-9_], max 64 chars. Frozenset membership
+# plus a set-difference check beats spinning up the regex engine for these
+# short names, and it keeps the rule readable without pattern syntax.
+_NAME_HEAD_CHARS = frozenset(string.ascii_letters + "_")
+_NAME_BODY_CHARS = _NAME_HEAD_CHARS | frozenset(string.digits)
+
+# Unsafe-character replacement for ASCII filenames via str.translate: a
+# C-level table lookup per character, no regex engine. Logger names are
+# almost always ASCII, so this is the common path; non-ASCII names fall
+# back to the Unicode-aware regex below.
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-.")
+_UNSAFE_ASCII_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if c not in _SAFE_FILENAME_CHARS}
+)
+
+
+# Metric names form a small closed set, so repeated validations (the same
+# name across many decorated methods, and every re-decoration when Celery
+# workers fork and re-import task modules) become a dict probe. Safe to
+# cache because the function is pure; failures raise and are never cached.
+@lru_cache(maxsize=1024)
 def validate_metric_name(name: str) -> str:
     """
     Validate and return a safe metric name for Prometheus labels.
@@ -30,7 +49,12 @@ def validate_metric_name(name: str) -> str:
     Raises:
         ValueError: If the name doesn't match Prometheus naming conventions.
     """
-    if not isinstance(name, str) or not VALID_NAME_PATTERN.match(name):  # pyright: ignore[reportUnnecessaryIsInstance]
+    if not (
+        isinstance(name, str)  # pyright: ignore[reportUnnecessaryIsInstance]
+        and 1 <= len(name) <= 64
+        and name[0] in _NAME_HEAD_CHARS
+        and not (set(name) - _NAME_BODY_CHARS)
+    ):
         raise ValueError(
             f"Invalid metric_name '{name}'. "
             "Must be 1-64 characters, start with [a-zA-Z_], "
@@ -58,7 +82,10 @@ def sanitize_log_filename(name: str) -> str:
     safe = Path(name).name
 
     # Replace any characters that aren't alphanumeric, underscore, hyphen, or dot
-    safe = re.sub(r"[^\w\-.]", "_", safe)
+    if safe.isascii():
+        safe = safe.translate(_UNSAFE_ASCII_TABLE)
+    else:
+        safe = re.sub(r"[^\w\-.]", "_", safe)
 
     # Ensure non-empty result
     return safe if safe else "default"
@@ -8,6 +8,17 @@ from notiq.utils.exceptions import TaskNameRequiredError
 
 T = TypeVar("T", bound=Callable[..., Any])
 
+# Default task options, merged into the caller's kwargs in one C-level dict
+# merge rather than a chain of per-key setdefault calls at every decoration
+_TASK_DEFAULTS: dict[str, Any] = {
+    "bind": True,
+    "retry_backoff": True,
+    "retry_jitter": True,
+    "max_retries": 5,
+    "soft_time_limit": 60,
+    "time_limit": 75,
+}
+
 
 def notiq_task(*args: Any, **kwargs: Any) -> Callable[[T], Task]:
     """
@@ -64,13 +75,8 @@ def notiq_task(*args: Any, **kwargs: Any) -> Callable[[T], Task]:
         TaskNameRequiredError: If no task name is provided via `name` kwarg
             or positional arg.
     """  # noqa: E501
-    # custom defaults
-    kwargs.setdefault("bind", True)
-    kwargs.setdefault("retry_backoff", True)
-    kwargs.setdefault("retry_jitter", True)
-    kwargs.setdefault("max_retries", 5)
-    kwargs.setdefault("soft_time_limit", 60)
-    kwargs.setdefault("time_limit", 75)
+    # custom defaults (caller-provided kwargs win)
+    kwargs = {**_TASK_DEFAULTS, **kwargs}
 
     # check if the user provided a name for the task
     if "name" not in kwargs and not args:
@@ -1,6 +1,43 @@
 import tzlocal
 from celery import Celery
 
+# Serialization on the broker path is the dominant CPU cost for task
+# payloads. When orjson is installed (notiq[speedups]) register it with
+# kombu under the standard application/json content type — same wire
+# format as stdlib json, several times faster to encode and decode — and
+# use it as the task serializer. Falls back to stdlib json otherwise;
+# "json" stays in accept_content either way for interop with producers
+# that don't have orjson.
+try:
+    import orjson
+    from kombu.serialization import register
+
+    register(
+        "orjson",
+        orjson.dumps,
+        orjson.loads,
+        content_type="application/json",
+        content_encoding="utf-8",
+    )
+    _TASK_SERIALIZER = "orjson"
+    _ACCEPT_CONTENT = ["orjson", "json"]
+except ImportError:
+    _TASK_SERIALIZER = "json"
+    _ACCEPT_CONTENT = ["json"]
+
+# Results (e.g. aggregate_analytics dicts) are written to the Redis result
+# backend, where the binary msgpack encoding is ~20% smaller than JSON and
+# faster to parse — less backend bandwidth and deserialization CPU. kombu
+# ships a msgpack codec that activates when the package is importable, so
+# only the config needs gating; task payloads stay on JSON for interop.
+try:
+    import msgpack  # noqa: F401
+
+    _RESULT_SERIALIZER = "msgpack"
+    _ACCEPT_CONTENT = [*_ACCEPT_CONTENT, "msgpack"]
+except ImportError:
+    _RESULT_SERIALIZER = _TASK_SERIALIZER
+
 
 def create_celery_app() -> Celery:
     """
@@ -89,9 +126,9 @@ def create_celery_app() -> Celery:
         # Task scheduler
         redbeat_redis_url="redis://localhost:6379/1",
         # Task settings
-        task_serializer="json",
-        accept_content=["json"],
-        result_serializer="json",
+        task_serializer=_TASK_SERIALIZER,
+        accept_content=_ACCEPT_CONTENT,
+        result_serializer=_RESULT_SERIALIZER,
         timezone=local_tz,
         enable_utc=True,
         # Time limits
@@ -116,5 +153,20 @@ def create_celery_app() -> Celery:
     return app
 
 
-# The global instance
-celery_app = create_celery_app()
+# Declared without a value so type checkers know the name exists; the
+# binding is created by __getattr__ below on first access.
+celery_app: Celery
+
+
+# The global instance, resolved lazily (PEP 562). This module is imported
+# whenever notiq.tasks.queue or a task module loads, and eager construction
+# would pay broker/backend URL parsing and conf setup even for code that
+# never touches the app. `from notiq.tasks.worker import celery_app` still
+# works — from-imports fall back to module __getattr__ — and the result is
+# cached in globals so this runs once.
+def __getattr__(name: str) -> Celery:
+    if name == "celery_app":
+        global celery_app
+        celery_app = create_celery_app()
+        return celery_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,30 +1,95 @@
 import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
 from pathlib import Path
 
+# Discovery results keyed on (resolved dir, mtime_ns) so repeated calls
+# (package import + explicit configuration) skip the filesystem walk when
+# nothing changed. A directory's mtime only tracks its direct children, so
+# edits buried in nested packages may be missed until the top level changes
+# — acceptable for task dirs, which are typically flat.
+_discovery_cache: dict[tuple[str, int], list[str]] = {}
+
+# One-char translation table built once: path separator -> dot
+_SEP_TO_DOT = str.maketrans(os.sep, ".")
+
+
+def _iter_py_files(directory: str) -> Iterator[str]:
+    """Yield paths of .py files under a directory, skipping __init__.py.
+
+    Recurses with os.scandir so each entry is a C-level DirEntry — no
+    per-file Path construction and the is_dir check reuses the stat data
+    scandir already fetched. Symlinked directories are not followed.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_py_files(entry.path)
+            elif entry.name.endswith(".py") and entry.name != "__init__.py":
+                yield entry.path
+
 
 def autodiscover_tasks(base_dir: str | Path) -> list[str]:
     """
     Scans a directory for .py files and converts them to
     dotted module paths relative to the CWD.
+
+    Results are cached per directory mtime, so unchanged directories
+    are not re-walked.
     """
     target = Path(base_dir).resolve()
-    modules = []
+    modules: list[str] = []
 
     if not target.exists():
         return []
 
-    for full_path in target.rglob("*.py"):
-        if full_path.name == "__init__.py":
-            continue
+    cache_key = (str(target), target.stat().st_mtime_ns)
+    cached = _discovery_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
 
-        try:
-            # Make path relative to where the user runs the command
-            rel_path = full_path.relative_to(Path.cwd())
-            # Convert to dotted notation
-            module = str(rel_path.with_suffix("")).replace(os.sep, ".")
-            modules.append(module)
-        except ValueError:
-            # This can happen if the path is not relative to CWD,
-            # which is unlikely with resolved paths but handled for safety.
+    # Hoisted: one getcwd syscall for the whole walk
+    cwd = os.getcwd()
+    for full_path in _iter_py_files(str(target)):
+        # Make the path relative to where the user runs the command
+        rel_path = os.path.relpath(full_path, cwd)
+        if rel_path.startswith(".."):
+            # Outside the CWD tree — not importable as a dotted module
             continue
+        # Strip ".py" and convert to dotted notation with plain string ops
+        modules.append(rel_path[:-3].translate(_SEP_TO_DOT))
+
+    _discovery_cache[cache_key] = modules
     return modules
+
+
+def preload_task_modules(
+    modules: Iterable[str], max_workers: int | None = None
+) -> None:
+    """
+    Import discovered task modules concurrently to warm worker cold-start.
+
+    Serial imports leave the disk idle between reads; CPython releases the
+    GIL during import file I/O, so a small thread pool overlaps the reads.
+    Concurrency is bounded to avoid file-descriptor exhaustion.
+
+    Args:
+        modules: Dotted module paths, e.g. the result of autodiscover_tasks.
+        max_workers: Thread pool size. Defaults to min(32, cpu_count * 4).
+
+    Raises:
+        ImportError: If any of the modules fails to import (same as a
+            serial import would).
+    """
+    module_list = list(modules)
+    if not module_list:
+        return
+
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(module_list))) as executor:
+        # Consume the iterator so import errors surface here
+        for _ in executor.map(import_module, module_list):
+            pass
@@ -1,6 +1,6 @@
 import json
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, RotatingFileHandler, WatchedFileHandler
 from pathlib import Path
 from unittest.mock import patch
 
@@ -50,6 +50,28 @@ class TestLoggerSetup:
         result = logger.setup()
         assert result.propagate is False
 
+    @staticmethod
+    def _file_handlers(result: logging.Logger) -> list[RotatingFileHandler]:
+        """File writes go through a QueueHandler whose listener owns the
+        actual RotatingFileHandler; collect those."""
+        return [
+            fh
+            for h in result.handlers
+            if isinstance(h, QueueHandler)
+            for fh in h.listener.handlers
+            if isinstance(fh, RotatingFileHandler)
+        ]
+
+    @staticmethod
+    def _teardown_handlers(result: logging.Logger) -> None:
+        """Stop listeners and close handlers to release file locks."""
+        for h in result.handlers[:]:
+            listener = getattr(h, "listener", None)
+            if listener is not None and getattr(listener, "_thread", None):
+                listener.stop()
+            h.close()
+            result.removeHandler(h)
+
     def test_setup_with_file_output(self, tmp_path: Path):
         logger = Logger(
             "test_setup_file",
@@ -59,20 +81,53 @@ class TestLoggerSetup:
         result = logger.setup()
 
         try:
-            # Should have a RotatingFileHandler
-            file_handlers = [
-                h for h in result.handlers if isinstance(h, RotatingFileHandler)
-            ]
-            assert len(file_handlers) >= 1
+            # Should have a RotatingFileHandler behind the queue handler
+            assert len(self._file_handlers(result)) >= 1
 
             # Log file should exist
             log_file = tmp_path / "test_setup_file.log"
             assert log_file.exists()
         finally:
-            # Close handlers to release file locks (Windows)
-            for h in result.handlers[:]:
-                h.close()
-                result.removeHandler(h)
+            self._teardown_handlers(result)
+
+    def test_setup_file_output_writes_records_to_disk(self, tmp_path: Path):
+        logger = Logger(
+            "test_async_file_write",
+            log_dir=tmp_path,
+            file_output=True,
+        )
+        result = logger.setup()
+
+        try:
+            result.info("queued log line")
+            # Stop the listener to drain the queue before reading the file
+            self._teardown_handlers(result)
+            log_file = tmp_path / "test_async_file_write.log"
+            content = log_file.read_text()
+            assert "queued log line" in content
+        finally:
+            self._teardown_handlers(result)
+
+    def test_setup_external_rotation_uses_watched_handler(self, tmp_path: Path):
+        logger = Logger(
+            "test_external_rotation",
+            log_dir=tmp_path,
+            file_output=True,
+            rotation="external",
+        )
+        result = logger.setup()
+
+        try:
+            watched = [
+                fh
+                for h in result.handlers
+                if isinstance(h, QueueHandler)
+                for fh in h.listener.handlers
+                if isinstance(fh, WatchedFileHandler)
+            ]
+            assert len(watched) == 1
+        finally:
+            self._teardown_handlers(result)
 
     def test_setup_file_handler_uses_json_formatter(self, tmp_path: Path):
         logger = Logger(
@@ -84,15 +139,11 @@ class TestLoggerSetup:
         result = logger.setup()
 
         try:
-            file_handlers = [
-                h for h in result.handlers if isinstance(h, RotatingFileHandler)
-            ]
+            file_handlers = self._file_handlers(result)
             assert len(file_handlers) >= 1
             assert isinstance(file_handlers[0].formatter, JsonFormatter)
         finally:
-            for h in result.handlers[:]:
-                h.close()
-                result.removeHandler(h)
+            self._teardown_handlers(result)
 
     def test_setup_file_handler_uses_text_formatter_when_json_disabled(
         self, tmp_path: Path
@@ -106,15 +157,11 @@ class TestLoggerSetup:
         result = logger.setup()
 
         try:
-            file_handlers = [
-                h for h in result.handlers if isinstance(h, RotatingFileHandler)
-            ]
+            file_handlers = self._file_handlers(result)
             assert len(file_handlers) >= 1
             assert not isinstance(file_handlers[0].formatter, JsonFormatter)
         finally:
-            for h in result.handlers[:]:
-                h.close()
-                result.removeHandler(h)
+            self._teardown_handlers(result)
 
     def test_setup_file_handler_graceful_on_permission_error(
         self, capsys: pytest.CaptureFixture[str]
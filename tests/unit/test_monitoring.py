@@ -12,7 +12,7 @@ from prometheus_client import (
     Summary,
 )
 
-from notiq import Logger, MetricBuilder, monitor
+from notiq import Logger, MetricBuilder, monitor, monitor_async, monitor_sync
 from notiq.monitoring.validation import sanitize_log_filename, validate_metric_name
 
 
@@ -178,6 +178,32 @@ def test_metrics_decorator_async():
     assert val == "Success"
 
 
+def test_monitor_sync_variant():
+    # the specialized sync variant skips the coroutine classification
+    @monitor_sync(metric_name="payment_sync_variant_test")
+    def payment(amount: float):
+        if amount < 0:
+            raise ValueError("Negative amount")
+        return "Success"
+
+    # verify decorated function returns expected output
+    assert payment(100) == "Success"
+
+
+def test_monitor_async_variant():
+    # the specialized async variant skips the coroutine classification
+    @monitor_async(metric_name="payment_async_variant_test")
+    async def payment(amount: float):
+        if amount < 0:
+            raise ValueError("Negative amount")
+        return "Success"
+
+    # run async function
+    val = asyncio.run(payment(100))
+    # verify decorated function returns expected output
+    assert val == "Success"
+
+
 def test_metrics_decorator_propagates_exception():
     @monitor(metric_name="payment_error_test")
     def payment(amount: float):
@@ -202,6 +228,36 @@ def test_metrics_decorator_async_propagates_exception():
         asyncio.run(payment(-1))
 
 
+def test_metrics_decorator_batch_mode_flushes_accumulated_metrics():
+    from prometheus_client import REGISTRY
+
+    from notiq.monitoring.decorators import flush_batched_metrics
+
+    # add monitoring decorator in batch mode
+    @monitor(metric_name="batch_mode_test", log_calls=False, batch=True)
+    def fast_func():
+        return "ok"
+
+    # call several times; updates stay in the thread-local accumulator
+    for _ in range(3):
+        assert fast_func() == "ok"
+
+    # force the pending updates into the real Prometheus metrics
+    flush_batched_metrics()
+
+    value = REGISTRY.get_sample_value(
+        "notiq_requests_total",
+        {"function_name": "batch_mode_test", "status": "success"},
+    )
+    assert value == 3.0
+
+    latency_count = REGISTRY.get_sample_value(
+        "notiq_request_latency_seconds_count",
+        {"function_name": "batch_mode_test"},
+    )
+    assert latency_count == 3.0
+
+
 def test_metrics_decorator_warns_on_generator_function():
     with warnings.catch_warnings(record=True) as w:
         warnings.simplefilter("always")
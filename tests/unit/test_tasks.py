@@ -1,11 +1,19 @@
 import json
+import os
+from pathlib import Path
 
 import pytest
 from celery import Celery, Task
 from celery.schedules import crontab
 from fakeredis import FakeStrictRedis
 
-from notiq import celery_app, notiq_scheduler, notiq_task, notiq_unscheduler
+from notiq import (
+    NotiqConfig,
+    celery_app,
+    notiq_scheduler,
+    notiq_task,
+    notiq_unscheduler,
+)
 from notiq.utils.exceptions import SchedulerValidationError, TaskNameRequiredError
 
 from .conftest import SCHEDULER_PARAM_NAMES, SCHEDULER_PARAMS
@@ -243,3 +251,75 @@ def test_notiq_scheduler_missing_schedule():
             name="test.task",
             task="notiq.tasks.send_email",
         )
+
+
+# ---------------------------------------------------------------------------
+# NotiqConfig tests
+# ---------------------------------------------------------------------------
+
+
+def test_notiq_config_invalid_url():
+    """Verify ValueError is raised for an invalid broker URL."""
+    with pytest.raises(ValueError, match="Invalid configuration provided"):
+        NotiqConfig(
+            BROKER_URL="not-a-valid-url",
+            RESULT_BACKEND="redis://localhost:6379/0",
+        )
+
+
+def test_notiq_config_repeated_calls_keep_include_stable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Verify calling NotiqConfig twice does not grow conf["include"]."""
+    # autodiscover resolves modules relative to the CWD, so create the
+    # task directory inside it
+    monkeypatch.chdir(tmp_path)
+    task_dir = tmp_path / "mytasks"
+    task_dir.mkdir()
+    (task_dir / "jobs.py").write_text("")
+
+    NotiqConfig(
+        BROKER_URL="redis://localhost:6379/0",
+        RESULT_BACKEND="redis://localhost:6379/0",
+        task_dir="mytasks",
+    )
+    include_after_first = list(celery_app.conf["include"])
+    assert "mytasks.jobs" in include_after_first
+
+    # a second identical call must not duplicate or reorder the entries
+    NotiqConfig(
+        BROKER_URL="redis://localhost:6379/0",
+        RESULT_BACKEND="redis://localhost:6379/0",
+        task_dir="mytasks",
+    )
+    assert list(celery_app.conf["include"]) == include_after_first
+
+
+def test_notiq_config_propagate_env(monkeypatch: pytest.MonkeyPatch):
+    """Verify propagate_env=True exports the NOTIQ_* variables."""
+    for var in ("NOTIQ_BROKER_URL", "NOTIQ_RESULT_BACKEND", "NOTIQ_TASK_DIR"):
+        monkeypatch.delenv(var, raising=False)
+
+    NotiqConfig(
+        BROKER_URL="redis://localhost:6379/0",
+        RESULT_BACKEND="redis://localhost:6379/1",
+        propagate_env=True,
+    )
+
+    # monkeypatch restores the environment after the test
+    assert os.environ["NOTIQ_BROKER_URL"] == "redis://localhost:6379/0"
+    assert os.environ["NOTIQ_RESULT_BACKEND"] == "redis://localhost:6379/1"
+
+
+def test_notiq_config_default_does_not_touch_env(monkeypatch: pytest.MonkeyPatch):
+    """Verify NotiqConfig leaves os.environ alone by default."""
+    for var in ("NOTIQ_BROKER_URL", "NOTIQ_RESULT_BACKEND", "NOTIQ_TASK_DIR"):
+        monkeypatch.delenv(var, raising=False)
+
+    NotiqConfig(
+        BROKER_URL="redis://localhost:6379/0",
+        RESULT_BACKEND="redis://localhost:6379/0",
+    )
+
+    assert "NOTIQ_BROKER_URL" not in os.environ
+    assert "NOTIQ_RESULT_BACKEND" not in os.environ